@@ -27,21 +27,49 @@
  *                                                                        *
  * Output                                                                 *
  *   Excel workbook with one sheet: "Transactions"                        *
+ *   or, if the output path ends in .parquet, a zstd-compressed Parquet   *
+ *   file (needs pyarrow; much faster to write, no Excel formatting).     *
  *                                                                        *
  * Notes                                                                  *
- *   - Parsing is based on text extraction from PDF pages via pdfplumber. *
+ *   - Parsing is based on text extraction from PDF pages via PyMuPDF     *
+ *     (if installed) or pdfplumber; choose with --parser (pypdfium2 is   *
+ *     also available there).                                             *
  *   - EZ-Pass PDF formats may vary; parsing uses defensive heuristics.   *
  **************************************************************************/
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
+from sys import intern
 from typing import Iterable, Optional
 
 import pandas as pd
 import pdfplumber
+import xlsxwriter
+from pdfplumber.utils.text import LIGATURES
+
+try:
+    import pymupdf  # optional C-backed text extraction (much faster)
+except ImportError:
+    pymupdf = None
+
+try:
+    import pypdfium2 as pdfium  # optional C++-backed text extraction (PDFium)
+except ImportError:
+    pdfium = None
+
+try:
+    import pyarrow  # optional Arrow-backed string columns / Parquet output
+except ImportError:
+    pyarrow = None
 
 # -------------------------------------------------
 # Regular expressions used for parsing
@@ -62,6 +90,189 @@ TIME_RE = re.compile(r"^\d{2}:\d{2}$")
 MONEY_RE = re.compile(r"^-?\$[\d,]+\.\d{2}$")
 TAG_RE = re.compile(r"^\d{8,}$")  # EZ-Pass tag / plate number
 
+# Characters removed from money strings before parsing: a translate table
+# for single values (money_to_float) and a compiled pattern for Series
+# (money_series_to_float). The "-" is kept; float() / pd.to_numeric parse it
+MONEY_STRIP_TABLE = str.maketrans("", "", "$,")
+MONEY_SYMBOLS_RE = re.compile(r"[$,]")
+
+# -------------------------------------------------
+# Whole-line transaction pattern (one pass per page)
+# -------------------------------------------------
+"""
+/**************************************************************************
+ * LINE_RE                                                                *
+ * ---------------------------------------------------------------------- *
+ * Matches a full page line that starts like a transaction row and has    *
+ * at least 4 tokens:                                                     *
+ *   - LANE_TXN_ID DATE + 2 more tokens   (new toll layout)               *
+ *   - DATE + 3 more tokens               (old toll / fee / payment)      *
+ * The named group that matched (lane / old / fee) is the row layout.     *
+ * Token gaps are runs of whitespace other than newline, so a match       *
+ * never runs into the next line.                                         *
+ **************************************************************************/
+"""
+LINE_RE = re.compile(
+    r"^[^\S\n]*"
+    r"(?:(?P<lane>\d+[^\S\n]+\d\d/\d\d/\d\d(?:[^\S\n]+\S+){2})"
+    r"|(?P<old>\d\d/\d\d/\d\d[^\S\n]+\d\d/\d\d/\d\d(?:[^\S\n]+\S+){2})"
+    r"|(?P<fee>\d\d/\d\d/\d\d(?:[^\S\n]+\S+){3}))"
+    r".*",
+    re.MULTILINE,
+)
+
+# Row layout tags (LINE_RE group names), see ROW_PARSERS
+LAYOUT_LANE = "lane"
+LAYOUT_OLD = "old"
+LAYOUT_FEE = "fee"
+
+# -------------------------------------------------
+# Fast token shape checks (hot path, no regex)
+# -------------------------------------------------
+def is_date_func(token: str) -> bool:
+    """
+    /**************************************************************************
+     * is_date(token)                                                         *
+     * ---------------------------------------------------------------------- *
+     * Same result as DATE_RE.match(token) (MM/DD/YY), using plain length /   *
+     * character checks instead of a regex call.                              *
+     **************************************************************************/
+    """
+    return (
+        len(token) == 8
+        and token[2] == "/"
+        and token[5] == "/"
+        and token[:2].isdecimal()
+        and token[3:5].isdecimal()
+        and token[6:].isdecimal()
+    )
+
+def is_time_func(token: str) -> bool:
+    """
+    /**************************************************************************
+     * is_time(token)                                                         *
+     * ---------------------------------------------------------------------- *
+     * Same result as TIME_RE.match(token) (HH:MM), without the regex call.   *
+     **************************************************************************/
+    """
+    return len(token) == 5 and token[2] == ":" and token[:2].isdecimal() and token[3:].isdecimal()
+
+# -------------------------------------------------
+# Unified transaction schema
+# -------------------------------------------------
+"""
+/**************************************************************************
+ * Transaction Columns                                                    *
+ * ---------------------------------------------------------------------- *
+ * The row parsers (ROW_PARSERS) return one tuple per row, aligned to     *
+ * COLUMNS; the IDX_* constants are the positions of each field.          *
+ *   - posting_date     : posted date in statement                        *
+ *   - transaction_date : old format had 2 dates (posting + transaction)  *
+ **************************************************************************/
+"""
+COLUMNS = (
+    "lane_txn_id",
+    "posting_date",
+    "transaction_date",
+    "tag_or_plate",
+    "agency",
+    "plaza",
+    "entry_date",
+    "entry_time",
+    "exit_plaza",
+    "exit_date",
+    "exit_time",
+    "plan",
+    "vehicle_class",
+    "amount",
+    "balance",
+    "description",
+)
+(
+    IDX_LANE_TXN_ID,
+    IDX_POSTING_DATE,
+    IDX_TRANSACTION_DATE,
+    IDX_TAG_OR_PLATE,
+    IDX_AGENCY,
+    IDX_PLAZA,
+    IDX_ENTRY_DATE,
+    IDX_ENTRY_TIME,
+    IDX_EXIT_PLAZA,
+    IDX_EXIT_DATE,
+    IDX_EXIT_TIME,
+    IDX_PLAN,
+    IDX_VEHICLE_CLASS,
+    IDX_AMOUNT,
+    IDX_BALANCE,
+    IDX_DESCRIPTION,
+) = range(len(COLUMNS))
+
+# Template for a full row with all supported columns (default None).
+# Parsers copy it with list(EMPTY_ROW), set fields by IDX_* position and
+# return the row as a tuple.
+EMPTY_ROW = (None,) * len(COLUMNS)
+
+# Columns of every parsed DataFrame: COLUMNS + numeric helper columns
+OUTPUT_COLUMNS = COLUMNS + ("amount_num", "balance_num")
+
+# Low-cardinality text columns: interned while parsing, stored as category
+CATEGORY_COLUMNS = (
+    "agency",
+    "plaza",
+    "exit_plaza",
+    "plan",
+    "vehicle_class",
+    "tag_or_plate",
+    "description",
+)
+
+# Other text columns: Arrow-backed strings when pyarrow is available
+# (contiguous buffers instead of one Python str object per cell)
+TEXT_DTYPE = "string[pyarrow]" if pyarrow is not None else object
+
+# -------------------------------------------------
+# PDF text-extraction backends
+# -------------------------------------------------
+"""
+/**************************************************************************
+ * Text Extraction Backends                                               *
+ * ---------------------------------------------------------------------- *
+ *   - pymupdf    : MuPDF C engine, fastest; used by default if installed.*
+ *   - pdfplumber : pure-Python pdfminer.six; slower, always available;   *
+ *                  default if pymupdf is missing.                        *
+ *   - pypdfium2  : PDFium C++ engine; only via --parser pypdfium2. Text  *
+ *                  follows drawing order and is not grouped into rows,   *
+ *                  so it only suits statements drawn row by row.         *
+ **************************************************************************/
+"""
+PARSER_MODULES = {"pymupdf": pymupdf, "pypdfium2": pdfium, "pdfplumber": pdfplumber}
+PARSERS = tuple(PARSER_MODULES)
+DEFAULT_PARSER = "pymupdf" if pymupdf is not None else "pdfplumber"
+
+# extract_text_simple() keeps ligature glyphs (e.g. one glyph for "fi"); expand
+# them the way extract_text() does (expand_ligatures=True)
+LIGATURE_TABLE = str.maketrans(LIGATURES)
+
+# -------------------------------------------------
+# Parsed-rows cache
+# -------------------------------------------------
+"""
+/**************************************************************************
+ * Row Cache                                                              *
+ * ---------------------------------------------------------------------- *
+ * Parsed rows of each PDF are stored as JSON (data only, never code)     *
+ *   <cache dir>/<key>.json                                               *
+ * where key hashes (CACHE_VERSION, parser, path, mtime, size). Re-runs   *
+ * over a folder only re-parse PDFs that changed.                         *
+ * Entries are kept in LRU order by file mtime (touched on every hit);    *
+ * after each run only the CACHE_MAX_ENTRIES most recent are kept.        *
+ * Bump CACHE_VERSION whenever parsing output changes.                    *
+ **************************************************************************/
+"""
+CACHE_VERSION = 3
+CACHE_MAX_ENTRIES = 500
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ezpass"
+
 # -------------------------------------------------
 # Main program entry point
 # -------------------------------------------------
@@ -71,14 +282,16 @@ def main() -> None:
      * main()                                                                 *
      * ---------------------------------------------------------------------- *
      * High-level flow                                                       *
-     *   1) Read command-line arguments (input PDF or folder, output XLSX).   *
+     *   1) Read command-line arguments (input PDF or folder, output file).   *
      *   2) Collect PDF files to process.                                     *
      *   3) Parse all PDFs -> one combined Transactions DataFrame.            *
-     *   4) Export DataFrame to Excel and apply basic formatting.             *
+     *   4) Export DataFrame to Excel and apply basic formatting, or to       *
+     *      Parquet when the output path ends in .parquet.                    *
      *                                                                        *
      * Excel formatting                                                      *
      *   - Freeze panes at A2 so the header stays visible.                    *
-     *   - Auto-size each column based on up to first 2000 rows.              *
+     *   - Auto-size each column based on up to first 2000 rows, computed     *
+     *     from the DataFrame (see column_widths()) rather than the cells.    *
      **************************************************************************/
     """
 
@@ -87,11 +300,30 @@ def main() -> None:
     # ***********************************************************************
     ap = argparse.ArgumentParser()
     ap.add_argument("input", type=str, help="PDF file or folder with PDFs")
-    ap.add_argument("output", type=str, help="Output Excel file (.xlsx)")
+    ap.add_argument("output", type=str, help="Output Excel file (.xlsx) or Parquet file (.parquet)")
+    ap.add_argument(
+        "--parser",
+        choices=PARSERS,
+        default=DEFAULT_PARSER,
+        help=f"PDF text-extraction backend (default: {DEFAULT_PARSER})",
+    )
+    ap.add_argument(
+        "--cache-dir",
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Folder for cached parse results (default: {DEFAULT_CACHE_DIR})",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="Always re-parse every PDF")
     args = ap.parse_args()
 
+    if PARSER_MODULES[args.parser] is None:
+        ap.error(f"--parser {args.parser} requires the '{args.parser}' package")
+
     input_path = Path(args.input).resolve()
     output_path = Path(args.output).resolve()
+    if output_path.suffix.lower() == ".parquet" and pyarrow is None:
+        ap.error("Parquet output requires the 'pyarrow' package")
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
 
     # ***********************************************************************
     # Input Collection                                                      *
@@ -103,115 +335,469 @@ def main() -> None:
     # PDF Parsing                                                           *
     #   Parse all PDFs and combine into one DataFrame.                       *
     # ***********************************************************************
-    tx_df = parse_many_func(pdf_files)
+    tx_df = parse_many_func(pdf_files, parser=args.parser, cache_dir=cache_dir)
+
+    # ***********************************************************************
+    # Parquet Export                                                        *
+    #   Columnar + zstd: skips the whole XLSX cost for non-Excel users.     *
+    # ***********************************************************************
+    if output_path.suffix.lower() == ".parquet":
+        tx_df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+        print(f"Saved Parquet: {output_path}")
+        return
 
     # ***********************************************************************
     # Excel Export                                                          *
     #   Write to "Transactions" sheet, freeze header row, auto-size columns. *
     # ***********************************************************************
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        tx_df.to_excel(writer, sheet_name="Transactions", index=False)
+    write_excel_func(tx_df, output_path)
 
-        ws = writer.book["Transactions"]
-        ws.freeze_panes = "A2"
+    print(f"Saved Excel: {output_path}")
 
-        # Auto-size columns
-        for col in ws.columns:
-            max_len = 0
-            col_letter = col[0].column_letter
-            for cell in col[:2000]:
-                if cell.value:
-                    max_len = max(max_len, len(str(cell.value)))
-            ws.column_dimensions[col_letter].width = min(max(10, max_len + 2), 45)
 
-    print(f"Saved Excel: {output_path}")
+# -------------------------------------------------
+# Write the transactions sheet (streaming)
+# -------------------------------------------------
+def write_excel_func(df: pd.DataFrame, output_path: Path, chunk_rows: int = 10_000) -> None:
+    """
+    /**************************************************************************
+     * write_excel(df, output_path, chunk_rows)                               *
+     * ---------------------------------------------------------------------- *
+     * Writes df to the "Transactions" sheet with xlsxwriter in               *
+     * constant_memory mode: each row is flushed to disk as soon as the next  *
+     * row starts, so no cell objects are kept for the whole sheet.           *
+     *                                                                        *
+     * Notes                                                                  *
+     *   - constant_memory requires strict row order. pandas' to_excel()     *
+     *     writes column by column, so rows are written here directly.        *
+     *   - Freeze pane and column widths are set before any row is written.  *
+     *   - Missing values (None / NaN) are written as blank cells; +-inf      *
+     *     (e.g. an "Infinity" amount token) as an Excel error cell instead   *
+     *     of aborting the export.                                            *
+     *   - Text is always written as text: URL-like strings do not become     *
+     *     hyperlinks.                                                        *
+     *   - Cells are converted to Python objects chunk_rows rows at a time,   *
+     *     so at most one slice (not the whole frame) is held as objects.     *
+     **************************************************************************/
+    """
+    workbook = xlsxwriter.Workbook(
+        str(output_path),
+        {"constant_memory": True, "nan_inf_to_errors": True, "strings_to_urls": False},
+    )
+    try:
+        ws = workbook.add_worksheet("Transactions")
+        ws.freeze_panes(1, 0)
+
+        # Auto-size columns (computed from the DataFrame, not the cells)
+        for idx, width in enumerate(column_widths_func(df)):
+            ws.set_column(idx, idx, width)
+
+        # Header row, styled like pandas' default Excel header
+        header_fmt = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        ws.write_row(0, 0, [str(name) for name in df.columns], header_fmt)
+
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=start + 1):
+                ws.write_row(row_idx, 0, row)
+    finally:
+        workbook.close()
+
+# -------------------------------------------------
+# Compute Excel column widths from a DataFrame
+# -------------------------------------------------
+def column_widths_func(df: pd.DataFrame, max_rows: int = 2000) -> list[int]:
+    """
+    /**************************************************************************
+     * column_widths(df, max_rows)                                            *
+     * ---------------------------------------------------------------------- *
+     * Returns one Excel column width per DataFrame column, in column order.  *
+     *                                                                        *
+     * Width rule                                                             *
+     *   - Longest text among the header and the first max_rows sheet rows    *
+     *     (header included), missing values ignored.                         *
+     *   - +2 padding, clamped to the range 10..45.                           *
+     *                                                                        *
+     * Lengths come from pandas' vectorized str.len(), so no worksheet        *
+     * cells have to be visited.                                              *
+     **************************************************************************/
+    """
+    sample = df.head(max_rows - 1)
+    widths = []
 
+    for name in df.columns:
+        values = sample[name].dropna()
+        max_len = len(str(name))
+        if not values.empty:
+            max_len = max(max_len, int(values.astype(str).str.len().max()))
+        widths.append(min(max(10, max_len + 2), 45))
+
+    return widths
 
 # -------------------------------------------------
 # Parse one file or many files
 # -------------------------------------------------
-def parse_many_func(inputs: list[Path]) -> pd.DataFrame:
+def parse_many_func(
+    inputs: list[Path],
+    parser: str = DEFAULT_PARSER,
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
     """
     /**************************************************************************
-     * parse_many(inputs)                                                    *
+     * parse_many(inputs, parser, cache_dir)                                 *
      * ---------------------------------------------------------------------- *
-     * Parses a list of PDF files and concatenates all results into one       *
-     * DataFrame.                                                            *
+     * Parses a list of PDF files and combines all rows into one DataFrame.   *
      *                                                                        *
      * Behavior                                                              *
-     *   - Each PDF is parsed independently via parse_pdf().                  *
-     *   - Results are concatenated with ignore_index=True.                   *
-     *   - If no PDFs are provided, returns an empty DataFrame.               *
+     *   - Each PDF is parsed independently into a list of row tuples via     *
+     *     parse_pdf_rows().                                                  *
+     *   - Multiple PDFs are parsed in parallel with a process pool           *
+     *     (one worker per PDF, capped at the CPU count).                     *
+     *   - A single PDF is parsed in-process to avoid pool start-up cost.     *
+     *   - parser selects the text-extraction backend (see PARSERS).          *
+     *   - cache_dir (optional) reuses rows of unchanged PDFs from disk and   *
+     *     is pruned to CACHE_MAX_ENTRIES afterwards.                         *
+     *   - Rows keep the input order and are turned into ONE DataFrame via    *
+     *     build_transactions_frame(): one allocation per column, no concat.  *
+     *   - If no PDFs are provided, returns an empty DataFrame with           *
+     *     OUTPUT_COLUMNS.                                                    *
      **************************************************************************/
     """
-    frames = []
-
-    for pdf in inputs:
-        frames.append(parse_pdf_func(pdf))
+    if len(inputs) > 1:
+        # ***********************************************************************
+        # Each PDF is independent -> parse them on separate cores.           *
+        # parse_pdf_rows_func() is top-level, so it pickles for the workers. *
+        # ***********************************************************************
+        max_workers = min(len(inputs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            per_pdf_rows = executor.map(
+                partial(parse_pdf_rows_func, parser=parser, cache_dir=cache_dir), inputs
+            )
+            tx_df = build_transactions_frame_func(chain.from_iterable(per_pdf_rows))
+    else:
+        tx_df = build_transactions_frame_func(
+            chain.from_iterable(parse_pdf_rows_func(pdf, parser, cache_dir) for pdf in inputs)
+        )
 
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    # Once per run, after all workers are done (no pruning races)
+    if cache_dir is not None:
+        prune_cache_func(cache_dir)
+    return tx_df
 
 # -------------------------------------------------
-# Parse a single PDF file
+# Parse a single PDF file into plain row tuples
 # -------------------------------------------------
-def parse_pdf_func(pdf_path: Path) -> pd.DataFrame:
+def parse_pdf_rows_func(
+    pdf_path: Path,
+    parser: str = DEFAULT_PARSER,
+    cache_dir: Optional[Path] = None,
+) -> list[tuple]:
     """
     /**************************************************************************
-     * parse_pdf(pdf_path)                                                   *
+     * parse_pdf_rows(pdf_path, parser, cache_dir)                           *
      * ---------------------------------------------------------------------- *
-     * Reads one PDF file and extracts transaction rows from all pages.       *
+     * Reads one PDF and returns its rows as raw COLUMNS tuples, so the       *
+     * caller can build one DataFrame for many PDFs (used by the process      *
+     * pool).                                                                 *
      *                                                                        *
-     * Steps                                                                  *
-     *   1) Open PDF with pdfplumber.                                         *
-     *   2) For each page: extract text.                                      *
-     *   3) Filter page text down to likely transaction lines.                *
-     *   4) Parse each line into a normalized row dict.                       *
-     *   5) Build a DataFrame from all rows.                                  *
-     *   6) Add numeric helper columns for amount and balance.                *
+     * Caching (only when cache_dir is given)                                 *
+     *   - Hit  : rows are loaded from the JSON entry (and its mtime is       *
+     *            touched for LRU pruning); the PDF is not opened.            *
+     *   - Miss : rows are parsed and written atomically (tmp + replace).     *
+     *   - Unreadable or malformed entries are ignored; the PDF is simply     *
+     *     parsed again and the entry rewritten.                              *
+     **************************************************************************/
+    """
+    if cache_dir is None:
+        return list(iter_rows_func(pdf_path, parser))
+
+    cache_file = cache_dir / f"{pdf_cache_key_func(pdf_path, parser)}.json"
+    cached = load_cached_rows_func(cache_file)
+    if cached is not None:
+        return cached
+
+    rows = list(iter_rows_func(pdf_path, parser))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # caching is best-effort
+
+    return rows
+
+# -------------------------------------------------
+# Read one cache entry
+# -------------------------------------------------
+def load_cached_rows_func(cache_file: Path) -> Optional[list[tuple]]:
+    """
+    /**************************************************************************
+     * load_cached_rows(cache_file)                                          *
+     * ---------------------------------------------------------------------- *
+     * Loads the rows stored in one cache entry.                              *
      *                                                                        *
      * Returns                                                                *
-     *   pandas DataFrame containing parsed rows for this PDF.                *
+     *   List of COLUMNS tuples, or None if the entry is missing, unreadable  *
+     *   or not a list of len(COLUMNS) rows of str / None values.             *
      **************************************************************************/
     """
+    try:
+        with open(cache_file, encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError, RecursionError):
+        return None  # cache miss, or not valid JSON
+
+    if not isinstance(data, list):
+        return None
+    width = len(COLUMNS)
     rows = []
+    for row in data:
+        if not isinstance(row, list) or len(row) != width:
+            return None
+        if not all(value is None or isinstance(value, str) for value in row):
+            return None
+        rows.append(tuple(row))
 
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            for line in iter_transaction_lines_func(text):
-                row = parse_transaction_line_func(line)
-                if row:
-                    rows.append(row)
+    try:
+        os.utime(cache_file)  # mark as recently used for prune_cache()
+    except OSError:
+        pass
+    return rows
 
-    df = pd.DataFrame(rows)
+# -------------------------------------------------
+# Drop least recently used cache entries
+# -------------------------------------------------
+def prune_cache_func(cache_dir: Path, max_entries: int = CACHE_MAX_ENTRIES) -> None:
+    """
+    /**************************************************************************
+     * prune_cache(cache_dir, max_entries)                                   *
+     * ---------------------------------------------------------------------- *
+     * Keeps only the max_entries most recently used entries (by mtime) in    *
+     * cache_dir, so entries of edited, moved or deleted PDFs do not pile up. *
+     * Only <key>.json files are touched; errors are ignored (best-effort).   *
+     **************************************************************************/
+    """
+    try:
+        entries = []
+        for entry in cache_dir.glob("*.json"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except OSError:
+                pass  # removed meanwhile
+    except OSError:
+        return  # no cache folder yet
+
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, entry in entries[: len(entries) - max_entries]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+# -------------------------------------------------
+# Cache key for one PDF
+# -------------------------------------------------
+def pdf_cache_key_func(pdf_path: Path, parser: str) -> str:
+    """
+    /**************************************************************************
+     * pdf_cache_key(pdf_path, parser)                                       *
+     * ---------------------------------------------------------------------- *
+     * Hash of (CACHE_VERSION, parser, absolute path, mtime_ns, size).        *
+     * Any edit / replacement of the PDF changes mtime or size -> new key.    *
+     **************************************************************************/
+    """
+    stat = pdf_path.stat()
+    ident = f"{CACHE_VERSION}|{parser}|{pdf_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.blake2b(ident.encode(), digest_size=16).hexdigest()
 
+# -------------------------------------------------
+# Build the Transactions DataFrame from row tuples
+# -------------------------------------------------
+def build_transactions_frame_func(rows: Iterable[tuple]) -> pd.DataFrame:
+    """
+    /**************************************************************************
+     * build_transactions_frame(rows)                                        *
+     * ---------------------------------------------------------------------- *
+     * Turns COLUMNS-ordered row tuples into the final DataFrame.             *
+     *                                                                        *
+     * Steps                                                                  *
+     *   1) Build the frame with an explicit object dtype.                    *
+     *   2) Add numeric helper columns for amount and balance.                *
+     *   3) Convert CATEGORY_COLUMNS to category dtype and the other text     *
+     *      columns to TEXT_DTYPE, in one astype().                           *
+     *                                                                        *
+     * Returns                                                                *
+     *   DataFrame with exactly OUTPUT_COLUMNS in order (also when empty).    *
+     **************************************************************************/
+    """
     # ***********************************************************************
-    # Keep date columns as strings (MM/DD/YY); ensure missing stays None.   *
+    # All COLUMNS are text: dtype=object skips per-column type inference,   *
+    # keeps dates as strings (MM/DD/YY) and keeps missing values as None.   *
     # ***********************************************************************
-    for col in ["posting_date", "transaction_date", "entry_date", "exit_date"]:
-        if col in df.columns:
-            df[col] = df[col].where(df[col].notna(), None)
+    df = pd.DataFrame(rows, columns=COLUMNS, dtype=object)
 
     # ***********************************************************************
     # Numeric helper columns for calculations / sorting / filtering.        *
+    # Added in one assign() so the block manager is not fragmented.         *
+    # Always added (even when empty) so every frame has OUTPUT_COLUMNS.     *
     # ***********************************************************************
-    if not df.empty:
-        df["amount_num"] = df["amount"].apply(money_to_float_func)
-        df["balance_num"] = df["balance"].apply(money_to_float_func)
+    df = df.assign(
+        amount_num=money_series_to_float_func(df["amount"]),
+        balance_num=money_series_to_float_func(df["balance"]),
+    )
 
-    return df
+    # ***********************************************************************
+    # Dictionary-encode repeated short strings (agency, plaza, tag, ...)    *
+    # and store the remaining text columns as TEXT_DTYPE. Explicit dtypes   *
+    # (not convert_dtypes) so all-empty columns stay text and balance_num   *
+    # stays float64 on every statement.                                     *
+    # ***********************************************************************
+    dtypes = {col: TEXT_DTYPE for col in COLUMNS}
+    dtypes.update({col: "category" for col in CATEGORY_COLUMNS})
+    return df.astype(dtypes)
+
+# -------------------------------------------------
+# Stream parsed transaction rows from a PDF
+# -------------------------------------------------
+def iter_rows_func(pdf_path: Path, parser: str = DEFAULT_PARSER) -> Iterable[tuple]:
+    """
+    /**************************************************************************
+     * iter_rows(pdf_path, parser)                                            *
+     * ---------------------------------------------------------------------- *
+     * Generator over every transaction row of one PDF, as COLUMNS tuples.    *
+     *                                                                        *
+     * Steps                                                                  *
+     *   1) Open PDF with the selected backend (see PARSERS).                 *
+     *   2) For each page: extract text.                                      *
+     *   3) Filter page text down to likely transaction lines (as tokens).    *
+     *   4) Parse each token list into a normalized row tuple with the        *
+     *      ROW_PARSERS entry for its layout.                                 *
+     *                                                                        *
+     * Pages are processed lazily, so only the current page's text is kept   *
+     * alive while rows are handed straight to the DataFrame builder.         *
+     **************************************************************************/
+    """
+    # Dispatch straight to the layout parser (see ROW_PARSERS)
+    row_parsers = ROW_PARSERS
+
+    for text in iter_page_texts_func(pdf_path, parser):
+        for layout, tokens in iter_transaction_tokens_func(text):
+            yield row_parsers[layout](tokens)
+
+# -------------------------------------------------
+# Extract plain text from each page of a PDF
+# -------------------------------------------------
+def iter_page_texts_func(pdf_path: Path, parser: str = DEFAULT_PARSER) -> Iterable[str]:
+    """
+    /**************************************************************************
+     * iter_page_texts(pdf_path, parser)                                      *
+     * ---------------------------------------------------------------------- *
+     * Yields the text of each page, one physical row per line, so that the   *
+     * line filter / parser below works the same for every backend.           *
+     *                                                                        *
+     * Backends                                                               *
+     *   - "pymupdf"    : words are regrouped into rows by their baseline     *
+     *                    (MuPDF's own "text" mode emits one line per cell).  *
+     *   - "pypdfium2"  : PDFium's get_text_range(); lines follow the order   *
+     *                    text is drawn in, so it suits statements that draw  *
+     *                    each row as one text run (CRLF line ends are fine;  *
+     *                    the line filter treats CR as a token gap).          *
+     *   - "pdfplumber" : page.extract_text_simple(), which clusters chars    *
+     *                    into rows without the word-clustering pass.         *
+     *                    Ligatures are expanded with LIGATURE_TABLE as       *
+     *                    extract_text() does; only the whitespace between    *
+     *                    tokens may then differ, and the parser splits on    *
+     *                    it anyway.                                          *
+     *                                                                        *
+     * Each page's cached objects are released as soon as its text has been  *
+     * yielded, and the document is always closed, even if the consumer      *
+     * stops early.                                                           *
+     **************************************************************************/
+    """
+    if parser == "pymupdf":
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            for page in doc:
+                yield pymupdf_page_text_func(page)
+        finally:
+            doc.close()
+        return
+
+    if parser == "pypdfium2":
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for index in range(len(pdf)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+        return
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        for page in pdf.pages:
+            try:
+                text = page.extract_text_simple(x_tolerance=3, y_tolerance=3) or ""
+                yield text.translate(LIGATURE_TABLE)
+            finally:
+                # pdf.pages keeps every Page alive; drop its cached chars /
+                # layout objects so memory stays at about one page
+                page.close()
+
+# -------------------------------------------------
+# Rebuild row-based text from a PyMuPDF page
+# -------------------------------------------------
+def pymupdf_page_text_func(page, y_tolerance: float = 3) -> str:
+    """
+    /**************************************************************************
+     * pymupdf_page_text(page, y_tolerance)                                   *
+     * ---------------------------------------------------------------------- *
+     * Groups the words of a PyMuPDF page into rows the same way pdfplumber   *
+     * does: words whose baselines are within y_tolerance points belong to    *
+     * the same row; each row is joined left-to-right with single spaces.     *
+     **************************************************************************/
+    """
+    # Word tuples: (x0, y0, x1, y1, text, block_no, line_no, word_no)
+    words = sorted(page.get_text("words"), key=lambda w: (w[3], w[0]))
+
+    lines = []
+    current = []
+    baseline = None
+    for word in words:
+        if baseline is not None and word[3] - baseline > y_tolerance:
+            lines.append(" ".join(w[4] for w in sorted(current, key=lambda w: w[0])))
+            current = []
+        if not current:
+            baseline = word[3]
+        current.append(word)
+    if current:
+        lines.append(" ".join(w[4] for w in sorted(current, key=lambda w: w[0])))
+
+    return "\n".join(lines)
 
 # -------------------------------------------------
 # Extract only the transaction lines from a page
 # -------------------------------------------------
-def iter_transaction_lines_func(page_text: str) -> Iterable[str]:
+def iter_transaction_tokens_func(page_text: str) -> Iterable[tuple[str, list[str]]]:
     """
     /**************************************************************************
-     * iter_transaction_lines(page_text)                                      *
+     * iter_transaction_tokens(page_text)                                     *
      * ---------------------------------------------------------------------- *
      * Goal                                                                    *
-     *   From a page's extracted text, yield only the lines that look like     *
-     *   transaction rows (tolls, fees, payments).                             *
+     *   From a page's extracted text, yield (layout, tokens) for the lines   *
+     *   that look like transaction rows (tolls, fees, payments). tokens is   *
+     *   line.split(); the parser consumes it directly, so each line is       *
+     *   split once, and layout is the LINE_RE group that matched.            *
      *                                                                          *
      * Supported line styles                                                   *
      *   A) New format (lane txn id first):                                    *
@@ -227,207 +813,208 @@ def iter_transaction_lines_func(page_text: str) -> Iterable[str]:
      *        Example: 12/11/24 12/10/24 ...                                   *
      *                                                                          *
      * Filtering strategy                                                      *
-     *   - Ignore blank lines.                                                 *
+     *   - Pages without any "/" (cover / summary pages) cannot hold a date   *
+     *     and are skipped with a single substring check.                      *
+     *   - One LINE_RE.finditer() pass over the page text; the regex engine   *
+     *     skips headers, footers, legends and blank lines.                    *
      *   - Require at least a few tokens.                                      *
      *   - Accept lines starting with:                                         *
      *        (digits + date) OR (date)                                        *
+     *   - Only matching lines are split into tokens.                          *
      **************************************************************************/
     """
-    for line in (ln.strip() for ln in page_text.splitlines()):
-        if not line:
-            continue
-
-        toks = line.split()
-        if len(toks) < 4:
-            continue
+    # Every transaction row contains an MM/DD/YY date
+    if "/" not in page_text:
+        return
 
-        # New format with lane id: digits + date
-        if toks[0].isdigit() and len(toks) > 1 and DATE_RE.match(toks[1]):
-            yield line
-            continue
-
-        # Old/fee formats: date at the beginning
-        if DATE_RE.match(toks[0]):
-            yield line
+    for match in LINE_RE.finditer(page_text):
+        yield match.lastgroup, match.group().split()
 
 # -------------------------------------------------
 # Parse one transaction line into structured data
 # -------------------------------------------------
-def parse_transaction_line_func(line: str) -> Optional[dict]:
+"""
+/**************************************************************************
+ * Row Parsers                                                            *
+ * ---------------------------------------------------------------------- *
+ * Each parser converts one statement row (the whitespace-split tokens of *
+ * a single text line, as yielded by iter_transaction_tokens) into a      *
+ * tuple aligned to COLUMNS, the unified schema of the output file.       *
+ *                                                                        *
+ * Unified Output Schema                                                  *
+ *   lane_txn_id, posting_date, transaction_date, tag_or_plate, agency,   *
+ *   plaza, entry_date, entry_time, exit_plaza, exit_date, exit_time,     *
+ *   plan, vehicle_class, amount, balance, description                    *
+ *                                                                        *
+ * Supported layouts (layout tag -> parser, see ROW_PARSERS)              *
+ *   1) LAYOUT_OLD  : old toll layout (two dates at start):               *
+ *        POSTING_DATE TXN_DATE TAG AGENCY PLAZA ... PLAN CL AMT BAL      *
+ *                                                                        *
+ *   2) LAYOUT_LANE : new toll layout (lane id + date):                   *
+ *        LANE_TXN_ID POSTED_DATE TAG AGENCY PLAZA ENTRY_DATE ENTRY_TIME  *
+ *        ... PLAN CL AMT BAL                                             *
+ *                                                                        *
+ *   3) LAYOUT_FEE  : fee / payment row (single date at start):           *
+ *        POSTED_DATE Description AMT BAL                                 *
+ *                                                                        *
+ * The layout was already decided by the line filter, so each parser      *
+ * reads its own fields with no further shape re-checks.                  *
+ *                                                                        *
+ * Heuristics used                                                        *
+ *   - We assume the last two tokens are AMOUNT and BALANCE.              *
+ *   - We keep parsing defensive: missing fields remain None.             *
+ **************************************************************************/
+"""
+
+# ***********************************************************************
+# Helper: entry / exit details found between PLAZA and PLAN CL AMT BAL. *
+# The "middle" is tokens[start:end]; it is walked by index so no slice  *
+# lists are allocated.                                                   *
+# ***********************************************************************
+def fill_entry_exit_func(row: list, tokens: list[str], start: int, end: int) -> None:
     """
     /**************************************************************************
-     * parse_transaction_line(line)                                           *
+     * fill_entry_exit(row, tokens, start, end)                               *
      * ---------------------------------------------------------------------- *
-     * Converts one statement row (a single text line) into a structured dict *
-     * that matches the unified schema used by the output Excel file.         *
-     *                                                                        *
-     * Unified Output Schema                                                  *
-     *   lane_txn_id, posting_date, transaction_date, tag_or_plate, agency,   *
-     *   plaza, entry_date, entry_time, exit_plaza, exit_date, exit_time,     *
-     *   plan, vehicle_class, amount, balance, description                    *
-     *                                                                        *
-     * Supported layouts                                                      *
-     *   1) Old toll layout (two dates at start):                             *
-     *        POSTING_DATE TXN_DATE TAG AGENCY PLAZA ... PLAN CL AMT BAL       *
-     *                                                                        *
-     *   2) New toll layout (lane id + date):                                 *
-     *        LANE_TXN_ID POSTED_DATE TAG AGENCY PLAZA ENTRY_DATE ENTRY_TIME   *
-     *        ... PLAN CL AMT BAL                                              *
-     *                                                                        *
-     *   3) Fee / payment row (single date at start):                         *
-     *        POSTED_DATE Description AMT BAL                                  *
-     *                                                                        *
-     * Heuristics used                                                        *
-     *   - We assume the last two tokens are AMOUNT and BALANCE.              *
-     *   - We keep parsing defensive: missing fields remain None.             *
+     * Fills entry date/time and the optional exit plaza/date/time of row     *
+     * (a list in COLUMNS order) from tokens[start:end], in place.            *
      **************************************************************************/
     """
-    tokens = line.split()
-    if len(tokens) < 4:
-        return None
+    # Bind hot-path helpers as locals (LOAD_FAST, no global lookup)
+    is_date = is_date_func
+    is_time = is_time_func
 
-    # ***********************************************************************
-    # Helper: build a full row with all supported columns (default None).   *
-    # ***********************************************************************
-    def empty_row() -> dict:
-        return {
-            "lane_txn_id": None,
-            "posting_date": None,          # posted date in statement
-            "transaction_date": None,      # old format had 2 dates (posting + transaction)
-            "tag_or_plate": None,
-            "agency": None,
-            "plaza": None,
-            "entry_date": None,
-            "entry_time": None,
-            "exit_plaza": None,
-            "exit_date": None,
-            "exit_time": None,
-            "plan": None,
-            "vehicle_class": None,
-            "amount": None,
-            "balance": None,
-            "description": None,
-        }
+    # Entry date/time is usually first in the middle
+    i = start
+    if is_date(tokens[i]):
+        row[IDX_ENTRY_DATE] = tokens[i]
+        if i + 1 < end and is_time(tokens[i + 1]):
+            row[IDX_ENTRY_TIME] = tokens[i + 1]
+        i += 2
+    # else: some statements insert extra plaza token, handle gracefully
 
-    # ***********************************************************************
-    # Basic tail assumption: last two tokens are amount and balance.        *
-    # ***********************************************************************
-    amount = tokens[-2]
-    balance = tokens[-1]
-
-    # ------------------------------------------------------------
-    # FORMAT B (new): starts with lane txn id (digits), then a date
-    # ------------------------------------------------------------
-    if tokens[0].isdigit() and DATE_RE.match(tokens[1]):
-        row = empty_row()
-        row["lane_txn_id"] = tokens[0]
-        row["posting_date"] = tokens[1]
-
-        # If not enough tokens to map to expected fields, keep description
-        if len(tokens) < 9:
-            # Not enough tokens to be meaningful
-            row["amount"] = amount
-            row["balance"] = balance
-            row["description"] = " ".join(tokens[2:-2]) if len(tokens) > 4 else None
-            return row
-
-        # Core fields (best-effort)
-        row["tag_or_plate"] = tokens[2]
-        row["agency"] = tokens[3] if len(tokens) > 3 else None
-        row["plaza"] = tokens[4] if len(tokens) > 4 else None
-
-        # Tail tokens typically: PLAN, CLASS, AMT, BAL
-        if len(tokens) >= 6:
-            row["plan"] = tokens[-4] if len(tokens) >= 6 else None
-            row["vehicle_class"] = tokens[-3] if len(tokens) >= 5 else None
-
-        # Middle = everything between plaza and tail
-        middle = tokens[5:-4]
-
-        # Entry date/time is usually first in the middle
-        if middle:
-            if DATE_RE.match(middle[0]):
-                row["entry_date"] = middle[0]
-                if len(middle) > 1 and TIME_RE.match(middle[1]):
-                    row["entry_time"] = middle[1]
-                rest = middle[2:]
-            else:
-                # If some statements insert extra plaza token, handle gracefully
-                rest = middle
-
-            # Optional exit info (rare)
-            if rest:
-                row["exit_plaza"] = rest[0]
-                if len(rest) > 1 and DATE_RE.match(rest[1]):
-                    row["exit_date"] = rest[1]
-                if len(rest) > 2 and TIME_RE.match(rest[2]):
-                    row["exit_time"] = rest[2]
-
-        row["amount"] = amount
-        row["balance"] = balance
-        return row
-
-    # ------------------------------------------------------------
-    # FORMAT A (old): starts with a posting date and then transaction date
-    # ------------------------------------------------------------
-    if DATE_RE.match(tokens[0]) and len(tokens) > 1 and DATE_RE.match(tokens[1]):
-        row = empty_row()
-        row["posting_date"] = tokens[0]
-        row["transaction_date"] = tokens[1]
-
-        # If 3rd token looks like a tag/plate -> toll row
-        # Otherwise it’s fee/payment row
-        row["tag_or_plate"] = tokens[2] if len(tokens) > 2 else None
-
-        # Short lines are usually fee/payment-like in older layout
-        if len(tokens) <= 6:
-            row["description"] = " ".join(tokens[2:-2])
-            row["amount"] = amount
-            row["balance"] = balance
-            return row
-
-        # Best-effort mapping for older layout
-        row["agency"] = tokens[3] if len(tokens) > 3 else None
-        row["plaza"] = tokens[4] if len(tokens) > 4 else None
-
-        row["plan"] = tokens[-4] if len(tokens) >= 6 else None
-        row["vehicle_class"] = tokens[-3] if len(tokens) >= 5 else None
-
-        middle = tokens[5:-4]
-
-        # Similar logic: parse entry/exit if present
-        if middle:
-            if DATE_RE.match(middle[0]):
-                row["entry_date"] = middle[0]
-                if len(middle) > 1 and TIME_RE.match(middle[1]):
-                    row["entry_time"] = middle[1]
-                rest = middle[2:]
-            else:
-                rest = middle
-
-            if rest:
-                row["exit_plaza"] = rest[0]
-                if len(rest) > 1 and DATE_RE.match(rest[1]):
-                    row["exit_date"] = rest[1]
-                if len(rest) > 2 and TIME_RE.match(rest[2]):
-                    row["exit_time"] = rest[2]
-
-        row["amount"] = amount
-        row["balance"] = balance
-        return row
-
-    # ------------------------------------------------------------
-    # Fee/payment rows (new PDF style): only one date at start
-    # ------------------------------------------------------------
-    if DATE_RE.match(tokens[0]):
-        row = empty_row()
-        row["posting_date"] = tokens[0]
-        row["description"] = " ".join(tokens[1:-2]) if len(tokens) > 3 else None
-        row["amount"] = amount
-        row["balance"] = balance
-        return row
-
-    return None
+    # Optional exit info (rare)
+    if i < end:
+        row[IDX_EXIT_PLAZA] = intern(tokens[i])
+        if i + 1 < end and is_date(tokens[i + 1]):
+            row[IDX_EXIT_DATE] = tokens[i + 1]
+        if i + 2 < end and is_time(tokens[i + 2]):
+            row[IDX_EXIT_TIME] = tokens[i + 2]
+
+# ------------------------------------------------------------
+# FORMAT B (new): starts with lane txn id (digits), then a date
+# ------------------------------------------------------------
+def parse_lane_row_func(tokens: list[str]) -> tuple:
+    """
+    /**************************************************************************
+     * parse_lane_row(tokens)                                                 *
+     * ---------------------------------------------------------------------- *
+     * LAYOUT_LANE row:                                                       *
+     *   LANE_TXN_ID POSTED_DATE TAG AGENCY PLAZA ENTRY_DATE ENTRY_TIME       *
+     *   ... PLAN CL AMT BAL                                                  *
+     * Lines with fewer than 9 tokens keep only the text between the date     *
+     * and the amounts as description.                                        *
+     **************************************************************************/
+    """
+    row = list(EMPTY_ROW)
+    row[IDX_LANE_TXN_ID] = tokens[0]
+    row[IDX_POSTING_DATE] = tokens[1]
+
+    # Basic tail assumption: last two tokens are amount and balance
+    row[IDX_AMOUNT] = tokens[-2]
+    row[IDX_BALANCE] = tokens[-1]
+
+    # If not enough tokens to map to expected fields, keep description
+    if len(tokens) < 9:
+        # Not enough tokens to be meaningful
+        row[IDX_DESCRIPTION] = intern(" ".join(tokens[2:-2])) if len(tokens) > 4 else None
+        return tuple(row)
+
+    # Core fields (best-effort)
+    row[IDX_TAG_OR_PLATE] = intern(tokens[2])
+    row[IDX_AGENCY] = intern(tokens[3])
+    row[IDX_PLAZA] = intern(tokens[4])
+
+    # Tail tokens typically: PLAN, CLASS, AMT, BAL
+    row[IDX_PLAN] = intern(tokens[-4])
+    row[IDX_VEHICLE_CLASS] = intern(tokens[-3])
+
+    # Middle = everything between plaza and tail: tokens[5:-4]
+    end = len(tokens) - 4
+    if end > 5:
+        fill_entry_exit_func(row, tokens, 5, end)
+
+    return tuple(row)
+
+# ------------------------------------------------------------
+# FORMAT A (old): starts with a posting date and then transaction date
+# ------------------------------------------------------------
+def parse_old_row_func(tokens: list[str]) -> tuple:
+    """
+    /**************************************************************************
+     * parse_old_row(tokens)                                                  *
+     * ---------------------------------------------------------------------- *
+     * LAYOUT_OLD row:                                                        *
+     *   POSTING_DATE TXN_DATE TAG AGENCY PLAZA ... PLAN CL AMT BAL           *
+     * Lines with at most 6 tokens are treated as fee / payment rows and      *
+     * keep the text between the dates and the amounts as description.        *
+     **************************************************************************/
+    """
+    row = list(EMPTY_ROW)
+    row[IDX_POSTING_DATE] = tokens[0]
+    row[IDX_TRANSACTION_DATE] = tokens[1]
+
+    # If 3rd token looks like a tag/plate -> toll row
+    # Otherwise it’s fee/payment row
+    row[IDX_TAG_OR_PLATE] = intern(tokens[2])
+
+    row[IDX_AMOUNT] = tokens[-2]
+    row[IDX_BALANCE] = tokens[-1]
+
+    # Short lines are usually fee/payment-like in older layout
+    if len(tokens) <= 6:
+        row[IDX_DESCRIPTION] = intern(" ".join(tokens[2:-2]))
+        return tuple(row)
+
+    # Best-effort mapping for older layout
+    row[IDX_AGENCY] = intern(tokens[3])
+    row[IDX_PLAZA] = intern(tokens[4])
+
+    row[IDX_PLAN] = intern(tokens[-4])
+    row[IDX_VEHICLE_CLASS] = intern(tokens[-3])
+
+    # Similar logic: parse entry/exit if present (tokens[5:-4])
+    end = len(tokens) - 4
+    if end > 5:
+        fill_entry_exit_func(row, tokens, 5, end)
+
+    return tuple(row)
+
+# ------------------------------------------------------------
+# Fee/payment rows (new PDF style): only one date at start
+# ------------------------------------------------------------
+def parse_fee_row_func(tokens: list[str]) -> tuple:
+    """
+    /**************************************************************************
+     * parse_fee_row(tokens)                                                  *
+     * ---------------------------------------------------------------------- *
+     * LAYOUT_FEE row:                                                        *
+     *   POSTED_DATE Description AMT BAL                                      *
+     **************************************************************************/
+    """
+    row = list(EMPTY_ROW)
+    row[IDX_POSTING_DATE] = tokens[0]
+    row[IDX_DESCRIPTION] = intern(" ".join(tokens[1:-2]))
+    row[IDX_AMOUNT] = tokens[-2]
+    row[IDX_BALANCE] = tokens[-1]
+    return tuple(row)
+
+# Layout tag -> specialized row parser
+ROW_PARSERS = {
+    LAYOUT_LANE: parse_lane_row_func,
+    LAYOUT_OLD: parse_old_row_func,
+    LAYOUT_FEE: parse_fee_row_func,
+}
 
 # -------------------------------------------------
 # Convert money string like "$1.74" to float 1.74
@@ -451,17 +1038,33 @@ def money_to_float_func(value: str) -> Optional[float]:
     if not value:
         return None
 
-    value = value.strip()
-    negative = value.startswith("-")
-
-    value = value.replace("$", "").replace(",", "").replace("-", "")
-
+    # One translate() pass drops "$" and ","; float() handles the sign
     try:
-        amount = float(value)
-        return -amount if negative else amount
+        return float(value.translate(MONEY_STRIP_TABLE).strip())
     except ValueError:
         return None
 
+# -------------------------------------------------
+# Convert a whole column of money strings to floats
+# -------------------------------------------------
+def money_series_to_float_func(values: pd.Series) -> pd.Series:
+    """
+    /**************************************************************************
+     * money_series_to_float(values)                                          *
+     * ---------------------------------------------------------------------- *
+     * Vectorized money_to_float() for a pandas Series; the string cleanup    *
+     * and number parsing run in pandas instead of one Python call per row.   *
+     *                                                                        *
+     * Rules (same as money_to_float)                                         *
+     *   - One regex pass removes "$" and ","; the "-" is kept so that        *
+     *     pd.to_numeric() parses the sign itself ("-$6.94" -> -6.94).        *
+     *   - Missing or unparseable values become NaN.                          *
+     **************************************************************************/
+    """
+    text = values.fillna("").astype(str).str.replace(MONEY_SYMBOLS_RE, "", regex=True)
+    # float64 also for an empty Series (pd.to_numeric would return int64)
+    return pd.to_numeric(text.str.strip(), errors="coerce").astype("float64")
+
 # -------------------------------------------------
 # Collect PDF files from input
 # -------------------------------------------------